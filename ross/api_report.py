@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-import toml
 from copy import copy
 from scipy.interpolate import interp1d
 from scipy.signal import argrelextrema
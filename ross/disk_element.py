@@ -2,7 +2,6 @@ import bokeh.palettes as bp
 from bokeh.models import ColumnDataSource, HoverTool
 import matplotlib.patches as mpatches
 import numpy as np
-import toml
 from ross.utils import read_table_file
 
 from ross.element import Element
@@ -161,6 +160,8 @@ class DiskElement(Element):
         >>> disk1 == list_of_disks[0]
         True
         """
+        import toml
+
         disk_elements = []
         with open("DiskElement.toml", "r") as f:
             disk_elements_dict = toml.load(f)
@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from collections import namedtuple
 
 import pandas as pd
-import toml
 
 
 class Element(ABC):
@@ -202,6 +201,8 @@ class Element(ABC):
         >>> BearingElement.load_data('BearingElement.toml') # doctest: +ELLIPSIS
         {'BearingElement': {'0': {'n': 0, 'kxx': [1000000.0, 1000000.0,...
         """
+        import toml
+
         try:
             with open(file_name, "r") as f:
                 data = toml.load(f)
@@ -237,6 +238,8 @@ class Element(ABC):
         >>> data = BearingElement.load_data('BearingElement.toml')
         >>> BearingElement.dump_data(data, 'bearing_data.toml')
         """
+        import toml
+
         with open(file_name, "w") as f:
             toml.dump(data, f)
 
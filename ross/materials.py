@@ -3,14 +3,76 @@
 This module defines the Material class and defines
 some of the most common materials used in rotors.
 """
+import copy
+import math
 import os
-import numpy as np
-import toml
+import re
+from functools import lru_cache
+from pathlib import Path
 
-import ross as rs
+import numpy as np
 
 __all__ = ["Material", "steel"]
 
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_TOML = Path(_PACKAGE_DIR) / "available_materials.toml"
+
+# Materials staged with save_material(defer=True), by file path.
+_PENDING = {}
+
+_VALID_NAME = re.compile(r"\S+").fullmatch
+
+_ELASTIC_PROPERTIES = frozenset(("E", "G_s", "Poisson"))
+
+# Functions used to derive each elastic property from the other two.
+_DERIVE = {
+    "E": lambda E, G_s, Poisson: G_s * (2 * (1 + Poisson)),
+    "G_s": lambda E, G_s, Poisson: E / (2 * (1 + Poisson)),
+    "Poisson": lambda E, G_s, Poisson: (E / (2 * G_s)) - 1,
+}
+
+
+def _toml_path(path):
+    """Return the absolute path of the materials file in the directory path."""
+    return Path(os.path.abspath(path)) / "available_materials.toml"
+
+
+def _check_name(name):
+    """Raise ValueError if name is not a valid material name."""
+    if not (isinstance(name, str) and _VALID_NAME(name)):
+        raise ValueError(
+            f"Invalid Material name {name!r}. The name must be a non-empty "
+            f"string and spaces are not allowed in Material name."
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_data_cached(path, mtime_ns):
+    """Parse a materials file.
+
+    The modification time is part of the cache key, so the file is parsed
+    again only when it changes on disk.
+
+    Returns
+    -------
+    data : dict
+        Parsed file.
+    names : tuple
+        Names of the materials in the file.
+    """
+    # TOML parsers are imported here so importing ross.materials doesn't load them.
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        import toml
+
+        with open(path, "r") as f:
+            data = toml.load(f)
+    else:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    return data, tuple(data["Materials"].keys())
+
 
 class Material:
     """Material used on shaft and disks.
@@ -44,127 +106,270 @@ class Material:
 
     """
 
-    def __init__(self, name, rho, **kwargs):
+    __slots__ = (
+        "_name",
+        "rho",
+        "E",
+        "Poisson",
+        "G_s",
+        "color",
+        "__weakref__",
+    )
 
-        assert name is not None, "Name not provided"
-        assert type(name) is str, "Name must be a string"
-        assert " " not in name, "Spaces are not allowed in Material name"
+    def __init__(self, name, rho, **kwargs):
+        _check_name(name)
+        provided = {k for k in _ELASTIC_PROPERTIES if kwargs.get(k) is not None}
         assert (
-            sum([1 if i in ["E", "G_s", "Poisson"] else 0 for i in kwargs]) > 1
+            len(provided) > 1
         ), "At least 2 arguments from E, G_s and Poisson should be provided"
 
-        self.name = name
+        self._name = name
         self.rho = rho
         self.E = kwargs.get("E", None)
         self.Poisson = kwargs.get("Poisson", None)
         self.G_s = kwargs.get("G_s", None)
         self.color = kwargs.get("color", "#525252")
 
-        if self.E is None:
-            self.E = self.G_s * (2 * (1 + self.Poisson))
-        elif self.G_s is None:
-            self.G_s = self.E / (2 * (1 + self.Poisson))
-        elif self.Poisson is None:
-            self.Poisson = (self.E / (2 * self.G_s)) - 1
+        missing = _ELASTIC_PROPERTIES - provided
+        if missing:
+            (prop,) = missing
+            setattr(self, prop, _DERIVE[prop](self.E, self.G_s, self.Poisson))
+
+    @classmethod
+    def batch(cls, names, rho, E=None, G_s=None, Poisson=None, color="#525252"):
+        """Create several materials at once.
+
+        The missing elastic property is derived for all materials with a
+        single array operation.
+
+        Parameters
+        ----------
+        names : list of str
+            Material names.
+        rho : array_like
+            Densities (N/m**3).
+        E : array_like, optional
+            Young's moduli (N/m**2).
+        G_s : array_like, optional
+            Shear moduli (N/m**2).
+        Poisson : array_like, optional
+            Poisson coefficients.
+        color : str or list of str, optional
+            Colors used on plots.
+
+        Returns
+        -------
+        materials : list
+            List with one Material for each name.
+
+        Examples
+        --------
+        >>> mats = Material.batch(
+        ...     ["AISI4140", "A216WCB"], rho=[7850, 7820], E=[203.2e9, 210e9],
+        ...     Poisson=[0.27, 0.29]
+        ... )
+        >>> round(mats[0].G_s)
+        80000000000
+        """
+        for name in names:
+            _check_name(name)
+
+        props = {"E": E, "G_s": G_s, "Poisson": Poisson}
+        missing = [k for k, v in props.items() if v is None]
+        assert (
+            len(missing) < 2
+        ), "At least 2 arguments from E, G_s and Poisson should be provided"
+
+        n = len(names)
+        props = {
+            k: np.broadcast_to(np.asarray(v, dtype=float), (n,))
+            for k, v in props.items()
+            if v is not None
+        }
+        if missing:
+            (prop,) = missing
+            props[prop] = _DERIVE[prop](
+                props.get("E"), props.get("G_s"), props.get("Poisson")
+            )
+        rho = np.broadcast_to(np.asarray(rho), (n,))
+        if isinstance(color, str):
+            color = [color] * n
+        elif len(color) != n:
+            raise ValueError(
+                f"Got {len(color)} colors for {n} materials. Pass one color for "
+                f"each name or a single color for all of them."
+            )
+
+        return [
+            cls._unchecked(*args)
+            for args in zip(
+                names,
+                rho.tolist(),
+                props["E"].tolist(),
+                props["G_s"].tolist(),
+                props["Poisson"].tolist(),
+                color,
+            )
+        ]
+
+    @classmethod
+    def _unchecked(cls, name, rho, E, G_s, Poisson, color="#525252"):
+        """Create a material from a complete set of trusted properties.
+
+        The argument checks and the derivation of missing properties done in
+        __init__ are skipped.
+        """
+        instance = object.__new__(cls)
+        instance._name = name
+        instance.rho = rho
+        instance.E = E
+        instance.Poisson = Poisson
+        instance.G_s = G_s
+        instance.color = color
+        return instance
+
+    @property
+    def name(self):
+        """Material name."""
+        return self._name
 
     def __eq__(self, other):
         """Material is considered equal if properties are equal."""
-        self_list = [v for v in self.__dict__.values() if isinstance(v, (float, int))]
-        other_list = [v for v in self.__dict__.values() if isinstance(v, (float, int))]
-
-        if np.allclose(self_list, other_list):
+        if self is other:
             return True
-        else:
-            return False
+        if not isinstance(other, Material):
+            return NotImplemented
+        # same tolerances as np.allclose
+        return (
+            math.isclose(self.rho, other.rho, rel_tol=1e-5, abs_tol=1e-8)
+            and math.isclose(self.E, other.E, rel_tol=1e-5, abs_tol=1e-8)
+            and math.isclose(self.G_s, other.G_s, rel_tol=1e-5, abs_tol=1e-8)
+            and math.isclose(self.Poisson, other.Poisson, rel_tol=1e-5, abs_tol=1e-8)
+        )
 
     def __repr__(self):
-        selfE = "{:.3e}".format(self.E)
-        selfPoisson = "{:.3e}".format(self.Poisson)
-        selfrho = "{:.3e}".format(self.rho)
-        selfGs = "{:.3e}".format(self.G_s)
-
         return (
             f"Material"
-            f'(name="{self.name}", rho={selfrho}, G_s={selfGs}, '
-            f"E={selfE}, Poisson={selfPoisson}, color={self.color!r})"
+            f'(name="{self.name}", rho={self.rho:.3e}, G_s={self.G_s:.3e}, '
+            f"E={self.E:.3e}, Poisson={self.Poisson:.3e}, color={self.color!r})"
         )
 
     def __str__(self):
         return (
             f"{self.name}"
             f'\n{35*"-"}'
-            f"\nDensity         (N/m**3): {float(self.rho):{2}.{8}}"
-            f"\nYoung`s modulus (N/m**2): {float(self.E):{2}.{8}}"
-            f"\nShear modulus   (N/m**2): {float(self.G_s):{2}.{8}}"
-            f"\nPoisson coefficient     : {float(self.Poisson):{2}.{8}}"
+            f"\nDensity         (N/m**3): {float(self.rho):2.8}"
+            f"\nYoung`s modulus (N/m**2): {float(self.E):2.8}"
+            f"\nShear modulus   (N/m**2): {float(self.G_s):2.8}"
+            f"\nPoisson coefficient     : {float(self.Poisson):2.8}"
         )
 
     @staticmethod
-    def dump_data(data):
-        with open("available_materials.toml", "w") as f:
-            toml.dump(data, f)
+    def dump_data(data, path=None):
+        """Write data to the available_materials.toml file in path.
+
+        If path is None the file distributed with ross is used.
+        """
+        toml_path = _DEFAULT_TOML if path is None else _toml_path(path)
+        try:
+            import tomli_w
+        except ImportError:
+            import toml
+
+            with open(toml_path, "w") as f:
+                toml.dump(data, f)
+        else:
+            with open(toml_path, "wb") as f:
+                tomli_w.dump(data, f)
+        _load_data_cached.cache_clear()
+
+    @staticmethod
+    def load_data(path=None):
+        """Read data from the available_materials.toml file in path.
+
+        If path is None the file distributed with ross is used.
+        """
+        data, _ = Material._read_data(path)
+        # Return a copy so callers can modify it without touching the cache.
+        return copy.deepcopy(data)
 
     @staticmethod
-    def load_data():
+    def _read_data(path=None):
+        """Return the cached data and material names of the file in path.
+
+        The file is created if it does not exist. The returned data is shared
+        with the cache and must not be modified.
+        """
+        toml_path = _DEFAULT_TOML if path is None else _toml_path(path)
         try:
-            with open("available_materials.toml", "r") as f:
-                data = toml.load(f)
+            mtime_ns = os.stat(toml_path).st_mtime_ns
         except FileNotFoundError:
-            data = {"Materials": {}}
-            Material.dump_data(data)
-        return data
+            Material.dump_data({"Materials": {}}, path)
+            mtime_ns = os.stat(toml_path).st_mtime_ns
+        return _load_data_cached(toml_path, mtime_ns)
 
     @staticmethod
-    def use_material(name):
-        run_path = os.getcwd()
-        ross_path = os.path.dirname(rs.__file__)
-        os.chdir(ross_path)
-
-        data = Material.load_data()
+    def use_material(name, path=None):
+        data, _ = Material._read_data(path)
         try:
             material = data["Materials"][name]
-            return Material(**material)
         except KeyError:
             raise KeyError("There isn't a instanced material with this name.")
-        os.chdir(run_path)
+        if _ELASTIC_PROPERTIES <= material.keys():
+            return Material._unchecked(**material)
+        return Material(**material)
 
     @staticmethod
-    def remove_material(name):
-        run_path = os.getcwd()
-        ross_path = os.path.dirname(rs.__file__)
-        os.chdir(ross_path)
-
-        data = Material.load_data()
+    def remove_material(name, path=None):
+        data = Material.load_data(path)
         try:
             del data["Materials"][name]
         except KeyError:
             return "There isn't a saved material with this name."
-        Material.dump_data(data)
-        os.chdir(run_path)
+        Material.dump_data(data, path)
 
     @staticmethod
-    def available_materials():
-        run_path = os.getcwd()
-        ross_path = os.path.dirname(rs.__file__)
-        os.chdir(ross_path)
-
+    def available_materials(path=None):
         try:
-            data = Material.load_data()
-            return list(data["Materials"].keys())
+            _, names = Material._read_data(path)
+            return list(names)
         except FileNotFoundError:
             return "There is no saved materials."
-        os.chdir(run_path)
-
-    def save_material(self):
-        """Saves the material in the available_materials list."""
-        run_path = os.getcwd()
-        ross_path = os.path.dirname(rs.__file__)
-        os.chdir(ross_path)
-
-        data = Material.load_data()
-        data["Materials"][self.name] = self.__dict__
-        Material.dump_data(data)
-        os.chdir(run_path)
+
+    def save_material(self, path=None, defer=False):
+        """Saves the material in the available_materials list.
+
+        If defer is True the material is only staged, and it is written
+        together with the other staged materials by Material.flush(path).
+        """
+        toml_path = _DEFAULT_TOML if path is None else _toml_path(path)
+        if defer:
+            _PENDING.setdefault(toml_path, {})[self.name] = self
+        else:
+            Material.save_many([self], path)
+
+    @staticmethod
+    def save_many(materials, path=None):
+        """Saves several materials with a single read and write of the file."""
+        data = Material.load_data(path)
+        for material in materials:
+            data["Materials"][material.name] = {
+                "name": material.name,
+                "rho": material.rho,
+                "E": material.E,
+                "G_s": material.G_s,
+                "Poisson": material.Poisson,
+                "color": material.color,
+            }
+        Material.dump_data(data, path)
+
+    @staticmethod
+    def flush(path=None):
+        """Writes the materials staged with save_material(defer=True)."""
+        toml_path = _DEFAULT_TOML if path is None else _toml_path(path)
+        pending = _PENDING.pop(toml_path, None)
+        if pending:
+            Material.save_many(pending.values(), path)
 
 
 steel = Material(name="Steel", rho=7810, E=211e9, G_s=81.2e9)
@@ -15,7 +15,6 @@ import scipy.io as sio
 import scipy.linalg as la
 import scipy.signal as signal
 import scipy.sparse.linalg as las
-import toml
 from bokeh.models import ColumnDataSource
 from bokeh.models.glyphs import Text
 from bokeh.plotting import figure, output_file
@@ -2000,6 +1999,8 @@ class Rotor(object):
         >>> rotor.save('new_rotor')
         >>> Rotor.remove('new_rotor')
         """
+        import toml
+
         main_path = os.path.dirname(ross.__file__)
         path = Path(main_path)
         path_rotors = path / "rotors"
@@ -2054,6 +2055,8 @@ class Rotor(object):
         True
         >>> Rotor.remove('new_rotor1')
         """
+        import toml
+
         main_path = os.path.dirname(ross.__file__)
         rotor_path = Path(main_path) / "rotors" / file_name
         try:
@@ -1,13 +1,8 @@
-import os
-from pathlib import Path
-
 import bokeh.palettes as bp
 import matplotlib.patches as mpatches
 import numpy as np
-import toml
 from bokeh.models import ColumnDataSource, HoverTool
 
-import ross
 from ross.element import Element
 from ross.materials import Material, steel
 from ross.utils import read_table_file
@@ -149,7 +144,6 @@ class ShaftElement(Element):
             raise AttributeError("Material is not defined.")
 
         if type(material) is str:
-            os.chdir(Path(os.path.dirname(ross.__file__)))
             self.material = Material.use_material(material)
         else:
             self.material = material
@@ -384,6 +378,8 @@ class ShaftElement(Element):
         >>> shaft2 # doctest: +ELLIPSIS
         [ShaftElement(L=0.25, idl=0.0...
         """
+        import toml
+
         shaft_elements = []
         with open("ShaftElement.toml", "r") as f:
             shaft_elements_dict = toml.load(f)
@@ -1131,14 +1127,11 @@ class ShaftElement(Element):
         material : ross.material
             Shaft material.
         n : int, optional
-            Element number (coincident with it's first node).
+            Number of the first element of the section. The following
+            elements are numbered sequentially.
             If not given, it will be set when the rotor is assembled
             according to the element's position in the list supplied to
             the rotor constructor.
-        axial_force : float
-            Axial force.
-        torque : float
-            Torque.
         shear_effects : bool
             Determine if shear effects are taken into account.
             Default is False.
@@ -1166,6 +1159,8 @@ class ShaftElement(Element):
         4
         >>> sec[0].i_d
         0.0
+        >>> [el.n for el in ShaftElement.section(0.5, 3, 0, 0.05, material=steel, n=2)]
+        [2, 3, 4]
         """
         if s_idr is None:
             s_idr = s_idl
@@ -1176,16 +1171,16 @@ class ShaftElement(Element):
 
         elements = [
             cls(
-                    le,
-                    (s_idr - s_idl) * i * le / L + s_idl,
-                    (s_odr - s_odl) * i * le / L + s_odl,
-                    (s_idr - s_idl) * (i + 1) * le / L + s_idl,
-                    (s_odr - s_odl) * (i + 1) * le / L + s_odl,
-                    material,
-                    n,
-                    shear_effects,
-                    rotary_inertia,
-                    gyroscopic
+                le,
+                (s_idr - s_idl) * i * le / L + s_idl,
+                (s_odr - s_odl) * i * le / L + s_odl,
+                (s_idr - s_idl) * (i + 1) * le / L + s_idl,
+                (s_odr - s_odl) * (i + 1) * le / L + s_odl,
+                material=material,
+                n=None if n is None else n + i,
+                shear_effects=shear_effects,
+                rotary_inertia=rotary_inertia,
+                gyroscopic=gyroscopic,
             )
             for i in range(ne)
         ]
@@ -1,10 +1,16 @@
+from functools import lru_cache
+
 import numpy as np
 import pytest
 
 import ross as rs
 from ross.materials import steel
 
+# The rotor_exampleN functions are cached, so tests that use the same number
+# of elements share the rotor. Tests must not modify the returned rotor.
+
 
+@lru_cache(maxsize=32)
 def rotor_example1(n_el=48):
     """
     This function instantiate a rotor similar to the example  5.9.1, page 206 (Dynamics of rotating machine, FRISSWELL)
@@ -18,16 +24,15 @@ def rotor_example1(n_el=48):
     :return: Rotor object.
     """
 
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    assert not n_el % 3, "n_el must be a multiple of 3"
+    n_third = n_el // 3
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     disk0 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5) * 0.5, material=steel, width=0.07, i_d=0.05, o_d=0.28
+        n=n_third, material=steel, width=0.07, i_d=0.05, o_d=0.28
     )
     disk1 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5), material=steel, width=0.07, i_d=0.05, o_d=0.35
+        n=n_two_thirds, material=steel, width=0.07, i_d=0.05, o_d=0.35
     )
 
     bearing0 = rs.BearingElement(n=0, kxx=1e6, kyy=1e6, cxx=0, cyy=0)
@@ -52,6 +57,7 @@ def test_example1_w_equals_4000rpm():
     )
 
 
+@lru_cache(maxsize=32)
 def rotor_example2(n_el=48):
     """
     This function instantiate a overhung rotor similar to the example  5.9.9, page 218 (Dynamics of rotating machine,
@@ -65,11 +71,9 @@ def rotor_example2(n_el=48):
     :return: Rotor object.
     """
 
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    assert not n_el % 3, "n_el must be a multiple of 3"
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     return rs.Rotor(
         shaft_elm,
         [
@@ -79,7 +83,7 @@ def rotor_example2(n_el=48):
         ],
         [
             rs.BearingElement(n=0, kxx=10e6, kyy=10e6, cxx=0, cyy=0),
-            rs.BearingElement(n=int((n_el / 1.5)), kxx=10e6, kyy=10e6, cxx=0, cyy=0),
+            rs.BearingElement(n=n_two_thirds, kxx=10e6, kyy=10e6, cxx=0, cyy=0),
         ],
     )
 
@@ -100,6 +104,7 @@ def test_example2_w_eq_4000rpm():
     )
 
 
+@lru_cache(maxsize=32)
 def rotor_example3(n_el=48):
     """
     This function instantiate a rotor similar to the example  5.9.2, page 208 (Dynamics of rotating machine, FRISSWELL)
@@ -112,16 +117,14 @@ def rotor_example3(n_el=48):
     :return: Rotor object.
     """
     assert not n_el % 3, "n_el must be a multiple of 3"
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    n_third = n_el // 3
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     disk0 = rs.DiskElement.from_geometry(
-        n=(n_el / 3), material=steel, width=0.07, i_d=0.05, o_d=0.28
+        n=n_third, material=steel, width=0.07, i_d=0.05, o_d=0.28
     )
     disk1 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5), material=steel, width=0.07, i_d=0.05, o_d=0.35
+        n=n_two_thirds, material=steel, width=0.07, i_d=0.05, o_d=0.35
     )
 
     bearing0 = rs.BearingElement(n=0, kxx=1e6, kyy=8e5, cxx=0, cyy=0)
@@ -146,6 +149,7 @@ def test_example3_w_equals_4000rpm():
     )
 
 
+@lru_cache(maxsize=32)
 def rotor_example4(n_el=48):
     """
     This function instantiate a rotor similar to the example  5.9.5, page 212 (Dynamics of rotating machine, FRISSWELL)
@@ -157,16 +161,15 @@ def rotor_example4(n_el=48):
     :param n_el: number of shaft elements.
     :return: Rotor object.
     """
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    assert not n_el % 3, "n_el must be a multiple of 3"
+    n_third = n_el // 3
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     disk0 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5) * 0.5, material=steel, width=0.07, i_d=0.05, o_d=0.28
+        n=n_third, material=steel, width=0.07, i_d=0.05, o_d=0.28
     )
     disk1 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5), material=steel, width=0.07, i_d=0.05, o_d=0.35
+        n=n_two_thirds, material=steel, width=0.07, i_d=0.05, o_d=0.35
     )
 
     bearing0 = rs.BearingElement(n=0, kxx=1e6, kyy=1e6, cxx=3e3, cyy=3e3)
@@ -201,6 +204,7 @@ def test_example4_w_equals_4000rpm():
     )
 
 
+@lru_cache(maxsize=32)
 def rotor_example5(n_el=48):
     """
     This function instantiate a rotor similar to the example  5.9.3, page 209 (Dynamics of rotating machine, FRISSWELL)
@@ -213,16 +217,15 @@ def rotor_example5(n_el=48):
     :return: Rotor object.
     """
 
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    assert not n_el % 3, "n_el must be a multiple of 3"
+    n_third = n_el // 3
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     disk0 = rs.DiskElement.from_geometry(
-        n=(n_el / 3), material=steel, width=0.07, i_d=0.05, o_d=0.28
+        n=n_third, material=steel, width=0.07, i_d=0.05, o_d=0.28
     )
     disk1 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5), material=steel, width=0.07, i_d=0.05, o_d=0.35
+        n=n_two_thirds, material=steel, width=0.07, i_d=0.05, o_d=0.35
     )
 
     bearing0 = rs.BearingElement(n=0, kxx=1e6, kyy=2e5, cxx=0, cyy=0)
@@ -240,6 +243,7 @@ def test_example5_w_equals4000rpm():
     ) / (2 * np.pi)
 
 
+@lru_cache(maxsize=32)
 def rotor_example6(n_el=48):
     """
     This function instantiate a rotor similar to the example  5.9.4, page 210 (Dynamics of rotating machine, FRISSWELL)
@@ -252,16 +256,15 @@ def rotor_example6(n_el=48):
     :return: Rotor object.
     """
 
-    shaft_elm = []
-    for i in range(n_el):
-        shaft_elm.append(
-            rs.ShaftElement(L=1.5 / n_el, material=steel, n=i, idl=0, odl=0.05)
-        )
+    assert not n_el % 3, "n_el must be a multiple of 3"
+    n_third = n_el // 3
+    n_two_thirds = 2 * n_el // 3
+    shaft_elm = rs.ShaftElement.section(1.5, n_el, 0, 0.05, material=steel, n=0)
     disk0 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5) * 0.5, material=steel, width=0.07, i_d=0.05, o_d=0.28
+        n=n_third, material=steel, width=0.07, i_d=0.05, o_d=0.28
     )
     disk1 = rs.DiskElement.from_geometry(
-        n=(n_el / 1.5), material=steel, width=0.07, i_d=0.05, o_d=0.35
+        n=n_two_thirds, material=steel, width=0.07, i_d=0.05, o_d=0.35
     )
 
     bearing0 = rs.BearingElement(n=0, kxx=1e6, kyy=1e6, cxx=0, kxy=5e5, cyy=0)
@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 
 import pytest
 from numpy.testing import assert_allclose
@@ -19,9 +21,15 @@ AISI4140 = Material(
 
 
 def test_raise_name_material():
-    with pytest.raises(AssertionError) as excinfo:
+    with pytest.raises(ValueError) as excinfo:
         mat = Material("with space", rho=7850, G_s=80e9, Poisson=0.27)
-    assert "Spaces are not allowed" in str(excinfo.value)
+    assert "spaces are not allowed" in str(excinfo.value)
+
+    with pytest.raises(ValueError):
+        Material("", rho=7850, G_s=80e9, Poisson=0.27)
+
+    with pytest.raises(ValueError):
+        Material(1, rho=7850, G_s=80e9, Poisson=0.27)
 
 
 def test_E():
@@ -52,6 +60,15 @@ def test_E_G_s_Poisson():
     assert_allclose(mat.Poisson, 0.27)
 
 
+def test_explicit_none():
+    mat = Material(name="test", rho=7850, E=203.2e9, G_s=80e9, Poisson=None)
+    assert_allclose(mat.Poisson, 0.27)
+    repr(mat)
+
+    with pytest.raises(AssertionError):
+        Material(name="test", rho=7850, E=203.2e9, G_s=None, Poisson=None)
+
+
 def test_specific_material():
     assert_allclose(AISI4140.rho, 7850)
     assert_allclose(AISI4140.E, 203.2e9)
@@ -84,14 +101,143 @@ def test_serialization():
     obj1 = Material(name="obj1", rho=92e1, E=281.21, G_s=20e9)
     obj1.save_material()
     obj2 = Material.use_material("obj1")
-    assert obj1.__dict__ == obj2.__dict__
+    assert obj1 == obj2
+    assert obj1.name == obj2.name
+    assert obj1.color == obj2.color
 
     obj1.remove_material("obj1")
     available_after = Material.available_materials()
     assert available == available_after
 
 
+def test_serialization_path(tmp_path):
+    obj1 = Material(name="obj1", rho=92e1, E=281.21, G_s=20e9)
+    obj1.save_material(path=tmp_path)
+    assert Material.available_materials(path=tmp_path) == ["obj1"]
+    assert Material.use_material("obj1", path=tmp_path) == obj1
+    assert "obj1" not in Material.available_materials()
+
+    Material.remove_material("obj1", path=tmp_path)
+    assert Material.available_materials(path=tmp_path) == []
+
+
 def test_repr():
-    mat0 = Material(name="obj1", rho=92e1, E=281.21, G_s=20e9)
+    mat0 = Material(name="obj1", rho=7850, E=203.2e9, G_s=80e9)
     mat1 = eval(repr(mat0))
     assert mat0 == mat1
+
+
+def test_eq():
+    mat0 = Material(name="obj1", rho=7850, E=203.2e9, G_s=80e9)
+    mat1 = Material(name="obj2", rho=7850, E=203.2e9, Poisson=0.27)
+    mat2 = Material(name="obj1", rho=7850, E=211e9, G_s=80e9)
+    assert mat0 == mat1
+    with pytest.raises(TypeError):
+        hash(mat0)
+    assert mat0 != mat2
+    assert mat0 != "obj1"
+
+
+def test_load_data_file_changed(tmp_path):
+    Material(name="mat0", rho=7850, E=203.2e9, G_s=80e9).save_material(path=tmp_path)
+    assert Material.available_materials(path=tmp_path) == ["mat0"]
+
+    toml_file = tmp_path / "available_materials.toml"
+    mtime_ns = toml_file.stat().st_mtime_ns
+    toml_file.write_text(
+        "[Materials.mat1]\n"
+        'name = "mat1"\n'
+        "rho = 7810\n"
+        "E = 211000000000.0\n"
+        "G_s = 81200000000.0\n"
+        "Poisson = 0.2992610837438423\n"
+        'color = "#525252"\n'
+    )
+    os.utime(toml_file, ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+
+    assert Material.available_materials(path=tmp_path) == ["mat1"]
+    assert Material.use_material("mat1", path=tmp_path) == steel
+    with pytest.raises(KeyError):
+        Material.use_material("mat0", path=tmp_path)
+
+
+def test_load_data_returns_copy():
+    data = Material.load_data()
+    data["Materials"]["not_saved"] = {}
+    assert "not_saved" not in Material.load_data()["Materials"]
+
+
+def test_use_material():
+    mat = Material.use_material("AISI4140")
+    assert mat == AISI4140
+    assert mat.name == "AISI4140"
+    assert mat.color == "#525252"
+    assert mat == Material(**Material.load_data()["Materials"]["AISI4140"])
+
+
+def test_str():
+    assert str(AISI4140) == (
+        "AISI4140"
+        "\n-----------------------------------"
+        "\nDensity         (N/m**3): 7850.0"
+        "\nYoung`s modulus (N/m**2): 2.032e+11"
+        "\nShear modulus   (N/m**2): 8e+10"
+        "\nPoisson coefficient     : 0.27"
+    )
+
+
+def test_batch():
+    mats = Material.batch(
+        ["mat0", "mat1"], rho=7850, G_s=[80e9, 81.2e9], Poisson=[0.27, 0.3]
+    )
+    assert mats[0] == Material(name="mat0", rho=7850, G_s=80e9, Poisson=0.27)
+    assert mats[1] == Material(name="mat1", rho=7850, G_s=81.2e9, Poisson=0.3)
+    assert [mat.name for mat in mats] == ["mat0", "mat1"]
+    assert type(mats[0].E) is float
+
+    mats = Material.batch(
+        ["mat0", "mat1"], rho=[7850, 7820], E=[203.2e9, 210e9], Poisson=[0.27, 0.29]
+    )
+    for mat, E, Poisson in zip(mats, [203.2e9, 210e9], [0.27, 0.29]):
+        scalar = Material(name=mat.name, rho=mat.rho, E=E, Poisson=Poisson)
+        assert_allclose(mat.G_s, scalar.G_s)
+        assert_allclose(mat.E, scalar.E)
+    assert_allclose([mat.G_s for mat in mats], [80e9, 81395348837.2093])
+    assert [mat.rho for mat in mats] == [7850, 7820]
+
+    with pytest.raises(AssertionError):
+        Material.batch(["mat0"], rho=7850, E=203.2e9)
+    with pytest.raises(ValueError):
+        Material.batch(["with space"], rho=7850, E=203.2e9, G_s=80e9)
+    with pytest.raises(ValueError):
+        Material.batch(["a", "b"], rho=7850, E=203.2e9, G_s=80e9, color=["red"])
+
+
+def test_save_many(tmp_path):
+    mats = Material.batch(["mat0", "mat1"], rho=7850, E=203.2e9, G_s=80e9)
+    Material.save_many(mats, path=tmp_path)
+    assert Material.available_materials(path=tmp_path) == ["mat0", "mat1"]
+    assert Material.use_material("mat1", path=tmp_path) == mats[1]
+
+
+def test_save_material_defer(tmp_path):
+    mat = Material(name="mat0", rho=7850, E=203.2e9, G_s=80e9)
+    mat.save_material(path=tmp_path, defer=True)
+    assert Material.available_materials(path=tmp_path) == []
+
+    Material.flush(path=tmp_path)
+    assert Material.available_materials(path=tmp_path) == ["mat0"]
+
+
+class SubMaterial(Material):
+    __slots__ = ()
+
+
+def test_copy():
+    mat = SubMaterial(name="obj1", rho=7850, E=203.2e9, G_s=80e9, color="red")
+    copies = [copy.copy(mat), copy.deepcopy(mat), pickle.loads(pickle.dumps(mat))]
+    for mat_copy in copies:
+        assert type(mat_copy) is SubMaterial
+        assert mat_copy == mat
+        assert mat_copy.name == "obj1"
+        assert mat_copy.color == "red"
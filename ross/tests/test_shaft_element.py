@@ -306,3 +306,10 @@ def test_match_gyroscopic_matrix(tap2, tim2):
     G_tap = tap2.G()
     G_tim = tim2.G()
     assert_almost_equal(G_tap, G_tim, decimal=5)
+
+
+def test_material_name_keeps_cwd(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    sh = ShaftElement(0.25, 0, 0.05, material="Steel")
+    assert sh.material == steel
+    assert os.getcwd() == str(tmp_path)